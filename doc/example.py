@@ -126,11 +126,13 @@ class DerivedClass(SampleClass):
     :param union: A union of several types.
     :param json: A complex type with type substitution.
     :param schema: A complex type without type substitution.
+    :param optional: An optional type with `None` listed first, emitted with `None` listed last.
     """
 
     union: SimpleType
     json: JsonType
     schema: Schema
+    optional: Union[None, int]
 
 
 @dataclass
@@ -5,11 +5,10 @@ import re
 import sys
 import types
 import typing
+import weakref
 from dataclasses import dataclass
 from typing import Annotated, Any, Callable, Optional, TypeVar, Union
 
-from pysqlsync.formation.inspection import dataclass_has_primary_key
-from pysqlsync.model.properties import FieldProperties, get_field_properties
 from sphinx.application import Sphinx
 from sphinx.errors import SphinxError
 from sphinx.ext.autodoc import ClassDocumenter, Options
@@ -28,11 +27,15 @@ from strong_typing.inspection import (
 )
 from strong_typing.name import python_type_to_str
 
+if typing.TYPE_CHECKING:
+    from pysqlsync.model.properties import FieldProperties
+
 
 class TypeTransform:
     "Maps a type to another type."
 
     type_transform: dict[str, TypeLike]
+    _str_cache: dict[int, tuple[TypeLike, str]]
 
     def __init__(
         self, type_transform: Optional[dict[TypeLike, TypeLike]] = None
@@ -44,6 +47,23 @@ class TypeTransform:
             }
         else:
             self.type_transform = {}
+        self._str_cache = {}
+
+    def _type_to_str(self, arg_type: TypeLike) -> str:
+        """
+        Emits a string representation of a Python type, re-using earlier results for the same type object.
+
+        Entries are keyed by object identity (as type annotations may carry unhashable metadata, and equality of
+        union types ignores member order) and hold a reference to the type to keep its identity stable.
+        """
+
+        entry = self._str_cache.get(id(arg_type))
+        if entry is not None:
+            return entry[1]
+
+        type_str = python_type_to_str(arg_type, use_union_operator=True)
+        self._str_cache[id(arg_type)] = (arg_type, type_str)
+        return type_str
 
     def __call__(self, arg_type: TypeLike) -> TypeLike:
         if isinstance(arg_type, str):
@@ -51,25 +71,35 @@ class TypeTransform:
                 f"expected: evaluated type; got: `str` with value: {arg_type}"
             )
 
-        mapped_type = self.type_transform.get(
-            python_type_to_str(arg_type, use_union_operator=True)
-        )
-        if mapped_type is not None:
-            return mapped_type
+        # skip rendering the type for lookup when no substitutions are configured, but still visit nested types
+        # such that optional types are normalized
+        if self.type_transform:
+            mapped_type = self.type_transform.get(self._type_to_str(arg_type))
+            if mapped_type is not None:
+                return mapped_type
 
         if is_type_annotated(arg_type):
             annotation_types = typing.get_args(arg_type)
             annotated_type = annotation_types[0]
             annotation_objects = annotation_types[1:]
             transformed_type = self(annotated_type)
+            if transformed_type is annotated_type:
+                return arg_type
             return Annotated[(transformed_type, *annotation_objects)]
         if is_type_optional(arg_type):
+            # always rebuild to emit `None` as the last member, irrespective of source order
             optional_type: TypeLike = unwrap_optional_type(arg_type)
             return Optional[self(optional_type)]
         if is_type_union(arg_type):
             union_type = unwrap_annotated_type(arg_type)
             union_types = unwrap_union_types(union_type)
-            return Union[tuple(self(member_type) for member_type in union_types)]
+            member_types = tuple(self(member_type) for member_type in union_types)
+            if type(None) not in union_types and all(
+                member_type is union_member
+                for member_type, union_member in zip(member_types, union_types)
+            ):
+                return arg_type
+            return Union[member_types]
 
         return arg_type
 
@@ -86,6 +116,10 @@ class MissingFieldError(SphinxError):
 
 T = TypeVar("T")
 
+_PARAM_RE = re.compile(r"^:param\s+([^:]+):(.*)$")
+
+_Handler = Callable[[Options, list[str]], None]
+
 
 class Processor:
     """
@@ -100,7 +134,14 @@ class Processor:
     """
 
     _symbols: Symbols
+    _column_prefixes: dict[tuple[bool, bool], str]
     _type_transform: TypeTransform
+    _str_cache: dict[int, tuple[TypeLike, str]]
+    _fields_cache: dict[int, tuple[type, dict[str, TypeLike]]]
+    _columns_cache: dict[int, tuple[type, dict[str, "FieldProperties"]]]
+    _hints_cache: dict[int, tuple[Callable[..., Any], dict[str, Any]]]
+    _prepared_cache: dict[int, tuple[object, dict[str, tuple[str, str]]]]
+    _handler_cache: dict[tuple[str, int], tuple[object, Optional[_Handler]]]
 
     def __init__(
         self,
@@ -119,59 +160,103 @@ class Processor:
         else:
             self._symbols = Symbols()
 
+        # description prefix keyed by whether a column is a primary key and whether it has a unique constraint
+        primary_key = self._symbols.primary_key
+        unique_constraint = self._symbols.unique_constraint
+        self._column_prefixes = {
+            (False, False): "",
+            (True, False): f"{primary_key} ",
+            (False, True): f"{unique_constraint} ",
+            (True, True): f"{primary_key} {unique_constraint} ",
+        }
+
         if type_transform is not None:
             self._type_transform = TypeTransform(type_transform)
         else:
             self._type_transform = TypeTransform()
 
+        self._str_cache = {}
+        self._fields_cache = {}
+        self._columns_cache = {}
+        self._hints_cache = {}
+        self._prepared_cache = {}
+        self._handler_cache = {}
+
     def _python_type_to_str(self, arg_type: TypeLike) -> str:
         """Emits a string representation of a Python type, with substitutions."""
 
+        entry = self._str_cache.get(id(arg_type))
+        if entry is not None:
+            return entry[1]
+
         transformed_type = self._type_transform(arg_type)
-        return python_type_to_str(transformed_type, use_union_operator=True)
+        type_str = python_type_to_str(transformed_type, use_union_operator=True)
+        self._str_cache[id(arg_type)] = (arg_type, type_str)
+        return type_str
 
     def _process_object(
         self,
+        obj: object,
         name: str,
         props: dict[str, T],
         lines: list[str],
-        transform: Callable[[T, str], tuple[str, str]],
+        prepare: Callable[[T], tuple[str, str]],
     ) -> None:
         """
         Lists all fields of a class including field name, type and description string.
 
+        :param obj: A plain class, a data-class or an entity class, or a function, or a method.
         :param name: Name of a plain class, a data-class or an entity class, or a function, or a method.
         :param props: Properties associated with each field of a plain class, a data-class or an entity class.
         :param lines: Documentation text as a multi-line string.
-        :param transform: A transformation that maps field properties and the original description to a type string
-            and an updated text.
+        :param prepare: A transformation that maps field properties to a type string and a description prefix.
         :raises MissingFieldError: Raised when a tag references a non-existent field.
         """
 
-        param_expr = re.compile(r"^:param\s+([^:]+):(.*)$")
-        for index, line in enumerate(lines):
-            match: Optional[re.Match] = param_expr.match(line)
+        candidates = [
+            index for index, line in enumerate(lines) if line.startswith(":param")
+        ]
+        if not candidates:
+            return
+
+        # type string and description prefix of fields, filled in as they are referenced by tags
+        entry = self._prepared_cache.get(id(obj))
+        if entry is not None:
+            prepared = entry[1]
+        else:
+            prepared = {}
+            self._prepared_cache[id(obj)] = (obj, prepared)
+
+        param_match = _PARAM_RE.match
+        for index in candidates:
+            match: Optional[re.Match] = param_match(lines[index])
             if not match:
                 continue
 
             field_name: str = match.group(1)
-            if field_name not in props:
-                raise MissingFieldError(
-                    f"param `{field_name}` is not declared as a field in the class `{name}`"
-                )
-
-            field_type, text = transform(props[field_name], match.group(2))
-            lines[index] = f":param {field_type} {field_name}: {text}"
-
-    def _transform_field(self, field_type: TypeLike, text: str) -> tuple[str, str]:
+            field = prepared.get(field_name)
+            if field is None:
+                try:
+                    prop = props[field_name]
+                except KeyError:
+                    raise MissingFieldError(
+                        f"param `{field_name}` is not declared as a field in the class `{name}`"
+                    ) from None
+
+                field = prepare(prop)
+                prepared[field_name] = field
+
+            field_type, prefix = field
+            lines[index] = f":param {field_type} {field_name}: {prefix}{match.group(2)}"
+
+    def _prepare_field(self, field_type: TypeLike) -> tuple[str, str]:
         """
-        Returns type information and description for a field in a class.
+        Returns type information and description prefix for a field in a class.
 
-        :param field_type: Field properties.
-        :param text: Original field description.
+        :param field_type: Field type.
         """
 
-        return self._python_type_to_str(field_type), text
+        return self._python_type_to_str(field_type), ""
 
     def _process_class(self, cls: type, lines: list[str]) -> None:
         """
@@ -181,12 +266,38 @@ class Processor:
         :param lines: Documentation text as a multi-line string.
         """
 
+        entry = self._fields_cache.get(id(cls))
+        if entry is not None:
+            fields = entry[1]
+        else:
+            module = sys.modules[cls.__module__]
+            fields = {
+                field_name: evaluate_type(field_type, module)
+                for field_name, field_type in get_class_properties(cls)
+            }
+            self._fields_cache[id(cls)] = (cls, fields)
+        self._process_object(cls, cls.__name__, fields, lines, self._prepare_field)
+
+    def _get_dataclass_fields(
+        self, cls: type[DataclassInstance]
+    ) -> dict[str, TypeLike]:
+        """
+        Returns (and caches) the evaluated type of each field in a data-class.
+
+        :param cls: A data-class.
+        """
+
+        entry = self._fields_cache.get(id(cls))
+        if entry is not None:
+            return entry[1]
+
         module = sys.modules[cls.__module__]
         fields: dict[str, TypeLike] = {
-            field_name: evaluate_type(field_type, module)
-            for field_name, field_type in get_class_properties(cls)
+            field.name: evaluate_type(field.type, module)
+            for field in dataclasses.fields(cls)
         }
-        self._process_object(cls.__name__, fields, lines, self._transform_field)
+        self._fields_cache[id(cls)] = (cls, fields)
+        return fields
 
     def _process_dataclass(
         self, cls: type[DataclassInstance], lines: list[str]
@@ -198,19 +309,14 @@ class Processor:
         :param lines: Documentation text as a multi-line string.
         """
 
-        module = sys.modules[cls.__module__]
-        fields: dict[str, TypeLike] = {
-            field.name: evaluate_type(field.type, module)
-            for field in dataclasses.fields(cls)
-        }
-        self._process_object(cls.__name__, fields, lines, self._transform_field)
+        fields = self._get_dataclass_fields(cls)
+        self._process_object(cls, cls.__name__, fields, lines, self._prepare_field)
 
-    def _transform_column(self, prop: FieldProperties, text: str) -> tuple[str, str]:
+    def _prepare_column(self, prop: "FieldProperties") -> tuple[str, str]:
         """
-        Returns type information and extended description for a field (column) in an entity (table).
+        Returns type information and description prefix for a field (column) in an entity (table).
 
         :param prop: Field properties.
-        :param text: Original field description.
         """
 
         source_type: TypeLike
@@ -223,16 +329,7 @@ class Processor:
         field_type = self._python_type_to_str(source_type)
 
         # emit an emoji for SQL primary key and unique constraint
-        pieces: list[str] = []
-        if prop.is_primary:
-            pieces.append(self._symbols.primary_key)
-        if prop.is_unique:
-            pieces.append(self._symbols.unique_constraint)
-        pieces.append(text)
-
-        description = " ".join(pieces)
-
-        return field_type, description
+        return field_type, self._column_prefixes[(prop.is_primary, prop.is_unique)]
 
     def _process_table(self, cls: type[DataclassInstance], lines: list[str]) -> None:
         """
@@ -242,16 +339,38 @@ class Processor:
         :param lines: Documentation text as a multi-line string.
         """
 
-        module = sys.modules[cls.__module__]
-        fields: dict[str, FieldProperties] = {
-            field.name: get_field_properties(evaluate_type(field.type, module))
-            for field in dataclasses.fields(cls)
-        }
-        self._process_object(cls.__name__, fields, lines, self._transform_column)
+        entry = self._columns_cache.get(id(cls))
+        if entry is not None:
+            columns = entry[1]
+        else:
+            from pysqlsync.model.properties import get_field_properties
+
+            columns = {
+                field_name: get_field_properties(field_type)
+                for field_name, field_type in self._get_dataclass_fields(cls).items()
+            }
+            self._columns_cache[id(cls)] = (cls, columns)
+
+        self._process_object(cls, cls.__name__, columns, lines, self._prepare_column)
+
+    def _get_function_hints(self, func: Callable[..., Any]) -> dict[str, Any]:
+        """
+        Returns (and caches) the evaluated type hints of a function.
+
+        :param func: A function or method.
+        """
+
+        entry = self._hints_cache.get(id(func))
+        if entry is not None:
+            return entry[1]
 
-    def _process_function(self, func: Callable[..., Any], lines: list[str]) -> None:
         params = typing.get_type_hints(func, include_extras=True)
-        self._process_object(func.__name__, params, lines, self._transform_field)
+        self._hints_cache[id(func)] = (func, params)
+        return params
+
+    def _process_function(self, func: Callable[..., Any], lines: list[str]) -> None:
+        params = self._get_function_hints(func)
+        self._process_object(func, func.__name__, params, lines, self._prepare_field)
 
     def _process_enum(
         self, cls: type[enum.Enum], options: Options, lines: list[str]
@@ -263,8 +382,8 @@ class Processor:
         :param lines: Documentation text as a multi-line string.
         """
 
-        options["undoc-members"] = True
-        return
+        if not options.get("undoc-members"):
+            options["undoc-members"] = True
 
     def _process_codeblock(self, lines: list[str]) -> None:
         """
@@ -276,21 +395,22 @@ class Processor:
         target_lines: list[str] = []
         code_block = False
         for source_line in lines:
-            if not code_block:
-                match: Optional[re.Match] = re.match(r"^```(.*)$", source_line)
-                if match:
-                    language: str = match.group(1)
-
-                    target_lines.append(f".. code-block:: {language}")
-                    target_lines.append("")
-                    code_block = True
-                else:
-                    target_lines.append(source_line)
-            else:
+            if code_block:
                 if source_line.startswith("```"):
                     code_block = False
                 else:
                     target_lines.append(f"    {source_line}")
+                continue
+
+            if not source_line.startswith("```"):
+                target_lines.append(source_line)
+                continue
+
+            language = source_line[3:]
+
+            target_lines.append(f".. code-block:: {language}")
+            target_lines.append("")
+            code_block = True
 
         lines[:] = target_lines
 
@@ -321,23 +441,53 @@ class Processor:
 
         self._process_codeblock(lines)
 
+        if what not in ("class", "exception", "function", "method"):
+            # no handler for modules, attributes, data and properties
+            return
+
+        key = (what, id(obj))
+        entry = self._handler_cache.get(key)
+        if entry is None:
+            entry = (obj, self._resolve_handler(what, obj))
+            self._handler_cache[key] = entry
+
+        handler = entry[1]
+        if handler is not None:
+            handler(options, lines)
+
+    def _resolve_handler(self, what: str, obj: object) -> Optional[_Handler]:
+        """
+        Selects the routine that processes the doc-string of an object.
+
+        :param what: The type of the object which the docstring belongs to.
+        :param obj: The object itself.
+        """
+
         if what == "class":
-            cls: type = typing.cast(type, obj)
+            assert isinstance(obj, type)
+            cls = obj
             if issubclass(cls, enum.Enum):
-                self._process_enum(cls, options, lines)
+                return lambda options, lines: self._process_enum(cls, options, lines)
             elif is_dataclass_type(cls):
+                # defer importing `pysqlsync` until an entity type may be encountered
+                from pysqlsync.formation.inspection import dataclass_has_primary_key
+
                 if dataclass_has_primary_key(cls):
-                    self._process_table(cls, lines)
+                    return lambda options, lines: self._process_table(cls, lines)
                 else:
-                    self._process_dataclass(cls, lines)
+                    return lambda options, lines: self._process_dataclass(cls, lines)
             elif inspect.isclass(cls):
-                self._process_class(cls, lines)
+                return lambda options, lines: self._process_class(cls, lines)
         elif what == "exception":
-            exc = typing.cast(type[Exception], obj)
-            self._process_class(exc, lines)
+            assert isinstance(obj, type)
+            exc = obj
+            return lambda options, lines: self._process_class(exc, lines)
         elif what in ["function", "method"]:
-            func = typing.cast(Callable[..., Any], obj)
-            self._process_function(func, lines)
+            assert callable(obj)
+            func = obj
+            return lambda options, lines: self._process_function(func, lines)
+
+        return None
 
     def _transform_param(
         self, param_type: TypeLike, module: types.ModuleType
@@ -375,6 +525,18 @@ class Processor:
         )
 
 
+# processor for each Sphinx application, released (along with its caches) when the application is discarded
+_default_processors: "weakref.WeakKeyDictionary[Sphinx, Processor]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _reset_processor(app: Sphinx, exception: Optional[Exception]) -> None:
+    "Discards the caches of the processor associated with a Sphinx application when a build completes."
+
+    _default_processors[app] = Processor()
+
+
 def process_docstring(
     app: Sphinx, what: str, name: str, obj: object, options: Options, lines: list[str]
 ) -> None:
@@ -387,7 +549,11 @@ def process_docstring(
     ```
     """
 
-    processor = Processor()
+    processor = _default_processors.get(app)
+    if processor is None:
+        processor = Processor()
+        _default_processors[app] = processor
+        app.connect("build-finished", _reset_processor)
     processor.process_docstring(app, what, name, obj, options, lines)
 
 